@@ -1,5 +1,11 @@
 """Test parsing ETS projects."""
 
+import json
+import os
+from pathlib import Path
+import shutil
+from unittest.mock import patch
+
 import pytest
 
 from xknxproject import XKNXProj
@@ -34,3 +40,93 @@ def test_parse_project(file_stem: str, password: str, language: str):
     )
     project = knxproj.parse()
     assert_stub(project, f"{file_stem}.json")
+
+
+def test_parse_project_results_independent():
+    """Test mutating a parsed project doesn't affect later parse results."""
+    knxproj = XKNXProj(RESOURCES_PATH / "xknx_test_project.knxproj", "test")
+    project = knxproj.parse()
+    for com_object in project["communication_objects"].values():
+        com_object["flags"]["read"] = None
+        for dpt in com_object["dpts"]:
+            dpt["sub"] = 999
+    for group_address in project["group_addresses"].values():
+        if group_address["dpt"]:
+            group_address["dpt"]["sub"] = 999
+
+    assert_stub(knxproj.parse(), "xknx_test_project.json")
+
+
+def test_parse_project_flags_not_shared():
+    """Test mutating flags of one communication object doesn't affect others."""
+    project = XKNXProj(RESOURCES_PATH / "xknx_test_project.knxproj", "test").parse()
+    com_objects = list(project["communication_objects"].values())
+    com_objects[0]["flags"]["read"] = None
+    assert all(co["flags"]["read"] is not None for co in com_objects[1:])
+
+
+def test_parse_project_group_address_dpts_not_shared():
+    """Test mutating the DPT of a group address doesn't affect others."""
+    project = XKNXProj(RESOURCES_PATH / "xknx_test_project.knxproj", "test").parse()
+    dpts = [ga["dpt"] for ga in project["group_addresses"].values() if ga["dpt"]]
+    for index, dpt in enumerate(dpts):
+        dpt["sub"] = -index
+    assert [dpt["sub"] for dpt in dpts] == [-index for index in range(len(dpts))]
+
+
+def test_parse_project_cache(tmp_path: Path):
+    """Test parsing a project is cached in cache_dir."""
+    knxproj = XKNXProj(
+        RESOURCES_PATH / "xknx_test_project.knxproj",
+        "test",
+        cache_dir=tmp_path,
+    )
+    project = knxproj.parse()
+    cache_files = list(tmp_path.iterdir())
+    assert len(cache_files) == 1
+
+    with patch("xknxproject.xknxproj.extract") as extract_mock:
+        cached_project = knxproj.parse()
+    extract_mock.assert_not_called()
+    assert cached_project == project
+    assert list(tmp_path.iterdir()) == cache_files
+
+    # different settings use a different cache file
+    XKNXProj(
+        RESOURCES_PATH / "xknx_test_project.knxproj",
+        "test",
+        language="de-DE",
+        cache_dir=tmp_path,
+    ).parse()
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_parse_project_cache_corrupt(tmp_path: Path):
+    """Test a corrupt cache file is ignored and replaced."""
+    knxproj = XKNXProj(
+        RESOURCES_PATH / "xknx_test_project.knxproj",
+        "test",
+        cache_dir=tmp_path,
+    )
+    project = knxproj.parse()
+    (cache_file,) = tmp_path.iterdir()
+    cache_file.write_text("garbage", encoding="utf-8")
+
+    assert knxproj.parse() == project
+    assert list(tmp_path.iterdir()) == [cache_file]
+    assert json.loads(cache_file.read_text(encoding="utf-8")) == project
+
+
+def test_parse_project_cache_stale(tmp_path: Path):
+    """Test the cache entry of a previous version of the file is removed."""
+    project_file = tmp_path / "project.knxproj"
+    cache_dir = tmp_path / "cache"
+    shutil.copy(RESOURCES_PATH / "xknx_test_project.knxproj", project_file)
+    knxproj = XKNXProj(project_file, "test", cache_dir=cache_dir)
+    knxproj.parse()
+    (old_cache_file,) = cache_dir.iterdir()
+
+    os.utime(project_file, ns=(0, 0))
+    knxproj.parse()
+    (new_cache_file,) = cache_dir.iterdir()
+    assert new_cache_file != old_cache_file
@@ -0,0 +1,29 @@
+"""Test password derivation for protected KNX projects."""
+
+from xknxproject.zip.crypto import _generate_ets6_zip_password, batch_derive_ets6
+
+
+def test_ets6_password_generation():
+    """Test generating ZIP password for ETS6 files."""
+    assert (
+        _generate_ets6_zip_password("a").decode("utf-8")
+        == "+FAwP4iI7/Pu4WB3HdIHbbFmteLahPAVkjJShKeozAA="
+    )
+    assert (
+        _generate_ets6_zip_password("test").decode("utf-8")
+        == "2+IIP7ErCPPKxFjJXc59GFx2+w/1VTLHjJ2duc04CYQ="
+    )
+    assert (
+        _generate_ets6_zip_password("Penn¥w1se 🤡").decode("utf-8")
+        == "ZjlYlh+eTtoHvFadU7+EKvF4jOdEm7WkP49uanOMMk0="
+    )
+
+
+def test_ets6_batch_password_generation():
+    """Test generating ZIP passwords for multiple ETS6 files."""
+    assert batch_derive_ets6(["a", "test", "a"]) == [
+        b"+FAwP4iI7/Pu4WB3HdIHbbFmteLahPAVkjJShKeozAA=",
+        b"2+IIP7ErCPPKxFjJXc59GFx2+w/1VTLHjJ2duc04CYQ=",
+        b"+FAwP4iI7/Pu4WB3HdIHbbFmteLahPAVkjJShKeozAA=",
+    ]
+    assert batch_derive_ets6([]) == []
@@ -1,10 +1,13 @@
 """Test reading KNX projects."""
 
+from __future__ import annotations
+
+import pytest
 from pytest import raises
 
 from xknxproject.exceptions import InvalidPasswordException
 from xknxproject.zip import extract
-from xknxproject.zip.extractor import _generate_ets6_zip_password
+from xknxproject.zip.extractor import _parse_xml_namespace
 
 from .. import RESOURCES_PATH
 
@@ -35,20 +38,29 @@ def test_extract_protected_knx_project_ets5():
         knx_project_contents.root.read("P-0242.signature")
 
 
-def test_ets6_password_generation():
-    """Test generating ZIP password for ETS6 files."""
-    assert (
-        _generate_ets6_zip_password("a").decode("utf-8")
-        == "+FAwP4iI7/Pu4WB3HdIHbbFmteLahPAVkjJShKeozAA="
-    )
-    assert (
-        _generate_ets6_zip_password("test").decode("utf-8")
-        == "2+IIP7ErCPPKxFjJXc59GFx2+w/1VTLHjJ2duc04CYQ="
-    )
-    assert (
-        _generate_ets6_zip_password("Penn¥w1se 🤡").decode("utf-8")
-        == "ZjlYlh+eTtoHvFadU7+EKvF4jOdEm7WkP49uanOMMk0="
-    )
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        (
+            b'<KNX xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns="http://knx.org/xml/project/21">\r\n',
+            "http://knx.org/xml/project/21",
+        ),
+        (
+            b'<?xml version="1.0" encoding="utf-8"?><KNX xmlns="http://knx.org/xml/project/11">',
+            "http://knx.org/xml/project/11",
+        ),
+        (b'<?xml version="1.0" encoding="utf-8"?>\r\n', None),
+        (b"<KNX xmlns=", None),
+        (
+            b'<KNX xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns="http://knx.org/xml/pr\xc3\xb6ject/21" xmlns="other">',
+            "http://knx.org/xml/pr\u00f6ject/21",
+        ),
+        (b'<KNX xmlns="http://knx.org/xml/\xff/21">', None),
+    ],
+)
+def test_parse_xml_namespace(line: bytes, expected: str | None):
+    """Test parsing the XML namespace from a line of knx_master.xml."""
+    assert _parse_xml_namespace(line) == expected
 
 
 def test_extract_protected_knx_project_ets6():
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import sys
 from xml.etree import ElementTree
 
 from xknxproject.exceptions import UnexpectedDataError
@@ -105,6 +106,7 @@ class ProjectLoader:
                     )
                 )
 
+        _ga_id_to_address = {ga.identifier: ga.address for ga in group_address_list}
         for function in functions:
             function.usage_text = (
                 knx_master_data.get_function_type_name(function.function_type)
@@ -114,12 +116,8 @@ class ProjectLoader:
 
             for group_address in function.group_addresses:
                 try:
-                    group_address.address = next(
-                        ga.address
-                        for ga in group_address_list
-                        if ga.identifier == group_address.ref_id
-                    )
-                except StopIteration:
+                    group_address.address = _ga_id_to_address[group_address.ref_id]
+                except KeyError:
                     raise UnexpectedDataError(
                         f"Group address {group_address.ref_id} referred in function not found"
                     ) from None
@@ -243,7 +241,8 @@ class _TopologyLoader:
             return None
 
         project_uid = device_element.get("Puid")
-        product_ref = device_element.get("ProductRefId", "")
+        # identical for all devices of the same product - share a single instance
+        product_ref = sys.intern(device_element.get("ProductRefId", ""))
 
         additional_addresses = [
             add_addr
@@ -302,9 +301,11 @@ class _TopologyLoader:
             description=device_element.get("Description", ""),
             last_modified=device_element.get("LastModified", ""),
             product_ref=product_ref,
-            hardware_program_ref=device_element.get("Hardware2ProgramRefId", ""),
+            hardware_program_ref=sys.intern(
+                device_element.get("Hardware2ProgramRefId", "")
+            ),
             line=line,
-            manufacturer=product_ref.split("_", 1)[0],
+            manufacturer=sys.intern(product_ref.split("_", 1)[0]),
             additional_addresses=additional_addresses,
             channels=channels,
             com_object_instance_refs=com_obj_inst_refs,
@@ -21,6 +21,19 @@ TranslationsType = dict[str, dict[str, str]]
 class XMLGroupAddress:
     """Class that represents a group address."""
 
+    __slots__ = (
+        "address",
+        "comment",
+        "data_secure_key",
+        "description",
+        "dpt",
+        "identifier",
+        "name",
+        "project_uid",
+        "raw_address",
+        "style",
+    )
+
     def __init__(
         self,
         name: str,
@@ -833,6 +846,15 @@ class XMLFunction:
 class XMLGroupAddressRef:
     """A GroupAddressRef in the functions XML."""
 
+    __slots__ = (
+        "address",
+        "identifier",
+        "name",
+        "project_uid",
+        "ref_id",
+        "role",
+    )
+
     address: str
     identifier: str
     name: str
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from pathlib import Path
+import tempfile
 import time
 
 from xknxproject.__version__ import __version__
@@ -23,11 +26,13 @@ class XKNXProj:
         path: str | Path,
         password: str | None = None,
         language: str | None = None,
+        cache_dir: str | Path | None = None,
     ):
         """Initialize a KNXProjParser."""
         self.path = Path(path)
         self.password = password
         self.language = language
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
     def parse(self, combine: bool = True) -> KNXProject:
         """Parse the KNX project."""
@@ -38,12 +43,24 @@ class XKNXProj:
             "" if self.password else "out",
         )
         _start = time.time()
+        cache_file = self._get_cache_file(combine)
+        if cache_file is not None and (project := _load_cache(cache_file)):
+            _LOGGER.info(
+                'Loaded cached project from "%s" in %s seconds',
+                cache_file,
+                time.time() - _start,
+            )
+            return project
+
         with extract(self.path, self.password) as knx_project_content:
             project = XMLParser(knx_project_content).parse(self.language)
 
         if combine:
             project = combine_project(project)
 
+        if cache_file is not None:
+            _store_cache(cache_file, project)
+
         _LOGGER.info("Parsing took %s seconds", time.time() - _start)
         _LOGGER.info(
             "Found %s group addresses, %s devices and %s used communication objects",
@@ -52,3 +69,68 @@ class XKNXProj:
             len(project["communication_objects"]),
         )
         return project
+
+    def _get_cache_file(self, combine: bool) -> Path | None:
+        """
+        Return the cache file path for the current archive and settings.
+
+        The name is `<settings key>-<archive key>.json`. Entries sharing the settings
+        key belong to previous versions of the same file and are stale.
+        """
+        if self.cache_dir is None:
+            return None
+        settings = "|".join(
+            (
+                str(self.path.resolve()),
+                hashlib.sha256((self.password or "").encode()).hexdigest(),
+                str(self.language),
+                str(combine),
+            )
+        )
+        stat = self.path.stat()
+        archive = "|".join((str(stat.st_mtime_ns), str(stat.st_size), __version__))
+        settings_key = hashlib.sha256(settings.encode()).hexdigest()
+        archive_key = hashlib.sha256(archive.encode()).hexdigest()
+        return self.cache_dir / f"{settings_key}-{archive_key}.json"
+
+
+def _load_cache(cache_file: Path) -> KNXProject | None:
+    """Load a parsed project from a cache file."""
+    try:
+        with cache_file.open(encoding="utf-8") as file:
+            project: KNXProject = json.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as err:
+        _LOGGER.warning('Could not load cache file "%s": %s', cache_file, err)
+        return None
+    return project
+
+
+def _store_cache(cache_file: Path, project: KNXProject) -> None:
+    """Store a parsed project in a cache file and remove stale entries."""
+    settings_key = cache_file.name.split("-", maxsplit=1)[0]
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # unique temporary file so concurrent writers don't interfere
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=cache_file.parent,
+            prefix=f"{settings_key}-",
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            tmp_file = Path(file.name)
+            try:
+                json.dump(project, file)
+            except BaseException:
+                file.close()
+                tmp_file.unlink(missing_ok=True)
+                raise
+        tmp_file.replace(cache_file)
+        for stale_file in cache_file.parent.glob(f"{settings_key}-*.json"):
+            if stale_file != cache_file:
+                stale_file.unlink(missing_ok=True)
+    except OSError as err:
+        _LOGGER.warning('Could not write cache file "%s": %s', cache_file, err)
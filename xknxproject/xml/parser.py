@@ -363,6 +363,14 @@ class XMLParser:
                 name=area.name, description=area.description, lines=lines_dict
             )
 
+        # reverse index to avoid scanning all communication objects for every GA
+        _ga_address_to_com_object_ids: dict[str, list[str]] = {}
+        for com_object_id, communication_object in communication_objects.items():
+            for ga_address in set(communication_object["group_address_links"]):
+                _ga_address_to_com_object_ids.setdefault(ga_address, []).append(
+                    com_object_id
+                )
+
         group_address_dict: dict[str, GroupAddress] = {
             group_address.address: GroupAddress(
                 name=group_address.name,
@@ -372,11 +380,9 @@ class XMLParser:
                 project_uid=group_address.project_uid,
                 dpt=group_address.dpt,
                 data_secure=bool(group_address.data_secure_key),
-                communication_object_ids=[
-                    com_object_id
-                    for com_object_id, com_object in communication_objects.items()
-                    if group_address.address in com_object["group_address_links"]
-                ],
+                communication_object_ids=_ga_address_to_com_object_ids.get(
+                    group_address.address, []
+                ),
                 description=group_address.description,
                 comment=html.unescape(rtf_to_text(group_address.comment)),
             )
@@ -0,0 +1,37 @@
+"""Password derivation for protected KNXProj files."""
+
+from __future__ import annotations
+
+import base64
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
+
+
+@lru_cache(maxsize=32)
+def _generate_ets6_zip_password(password: str) -> bytes:
+    """Generate ZIP archive password. Cached - key derivation is expensive."""
+
+    return base64.b64encode(
+        hashlib.pbkdf2_hmac(
+            hash_name="sha256",
+            password=password.encode("utf-16-le"),
+            salt=b"21.project.ets.knx.org",
+            iterations=65536,
+            dklen=32,
+        )
+    )
+
+
+def batch_derive_ets6(
+    passwords: Iterable[str], max_workers: int | None = None
+) -> list[bytes]:
+    """
+    Generate ZIP archive passwords for multiple ETS6 project passwords.
+
+    Key derivation is CPU bound but releases the GIL, so it is run in a
+    thread pool. Only useful when opening many protected projects at once.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_generate_ets6_zip_password, passwords))
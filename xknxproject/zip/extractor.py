@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import base64
 from collections.abc import Iterator
 from contextlib import contextmanager
-import hashlib
+import io
 import logging
-from pathlib import Path
+import os
 import re
 from typing import IO
 from zipfile import Path as ZipPath, ZipFile, ZipInfo
@@ -20,9 +19,13 @@ from xknxproject.exceptions import (
     ProjectNotFoundException,
     UnexpectedFileContent,
 )
+from xknxproject.zip.crypto import _generate_ets6_zip_password
 
 _LOGGER = logging.getLogger("xknxproject.log")
 
+_READ_BUFFER_SIZE = 1 << 16
+_XMLNS_RE = re.compile(rb'.+? xmlns="(.+?)"')
+
 
 class KNXProjContents:
     """Class for holding the contents of a KNXProj file."""
@@ -48,23 +51,29 @@ class KNXProjContents:
 
     def open_project_0(self) -> IO[bytes]:
         """Open the project 0.xml file."""
-        return self._project_archive.open(
-            f"{self._project_relative_path}0.xml",
-            mode="r",
+        return io.BufferedReader(  # type: ignore[type-var]
+            self._project_archive.open(
+                f"{self._project_relative_path}0.xml",
+                mode="r",
+            ),
+            buffer_size=_READ_BUFFER_SIZE,
         )
 
     def open_project_meta(self) -> IO[bytes]:
         """Open the project.xml file."""
         project_filename = "Project.xml" if self.is_ets4_project() else "project.xml"
-        return self._project_archive.open(
-            f"{self._project_relative_path}{project_filename}",
-            mode="r",
+        return io.BufferedReader(  # type: ignore[type-var]
+            self._project_archive.open(
+                f"{self._project_relative_path}{project_filename}",
+                mode="r",
+            ),
+            buffer_size=_READ_BUFFER_SIZE,
         )
 
 
 @contextmanager
 def extract(
-    archive_path: Path, password: str | None = None
+    archive_path: str | os.PathLike[str], password: str | None = None
 ) -> Iterator[KNXProjContents]:
     """Provide the contents of a KNXProj file."""
     _LOGGER.debug('Opening KNX Project file "%s"', archive_path)
@@ -108,9 +117,9 @@ def extract(
 
 def _get_project_id(zip_archive: ZipFile) -> str:
     """Get the project id."""
-    for info in zip_archive.infolist():
-        if info.filename.startswith("P-") and info.filename.endswith(".signature"):
-            return info.filename.removesuffix(".signature")
+    for name in zip_archive.namelist():
+        if name.startswith("P-") and name.endswith(".signature"):
+            return name.removesuffix(".signature")
 
     raise ProjectNotFoundException("Signature file not found.")
 
@@ -146,29 +155,43 @@ def _extract_protected_project_file(
 def _get_xml_namespace(project_zip: ZipFile) -> str:
     """Get the XML namespace of the project."""
     with project_zip.open("knx_master.xml", mode="r") as master:
-        for line_number, line in enumerate(master, start=1):
-            # ETS 4.1 has namespace in the first line, newer versions in second
-            if line_number in (1, 2):
-                try:
-                    namespace_match = re.match(
-                        r".+ xmlns=\"(.+?)\"",
-                        line.decode(),
-                    )
-                    if namespace_match is None and line_number == 1:
-                        continue
-                    namespace = namespace_match.group(1)  # type: ignore[union-attr]
-                    _LOGGER.debug("Namespace: %s", namespace)
-                    return namespace
-                except (AttributeError, IndexError, UnicodeDecodeError):
-                    _LOGGER.error("Could not parse XML namespace from %s", line)
-                    raise UnexpectedFileContent(
-                        "Could not parse XML namespace."
-                    ) from None
-            else:
+        # ETS 4.1 has namespace in the first line, newer versions in second
+        # only read these lines - the rest of the file is not decompressed
+        for line_number in (1, 2):
+            line = master.readline()
+            if not line:
                 break
+            namespace = _parse_xml_namespace(line)
+            if namespace is None:
+                if line_number == 1:
+                    continue
+                _LOGGER.error("Could not parse XML namespace from %s", line)
+                raise UnexpectedFileContent("Could not parse XML namespace.")
+            _LOGGER.debug("Namespace: %s", namespace)
+            return namespace
         raise UnexpectedFileContent("Could not find XML namespace.")
 
 
+def _parse_xml_namespace(line: bytes) -> str | None:
+    """Parse the value of the first `xmlns` attribute from a raw XML line."""
+    try:
+        start = line.index(b' xmlns="') + len(b' xmlns="')
+        end = line.index(b'"', start)
+    except ValueError:
+        return None
+    try:
+        return line[start:end].decode("ascii")
+    except UnicodeDecodeError:
+        pass
+    # only reached for non-ASCII namespace values - decode the whole line
+    if (namespace_match := _XMLNS_RE.match(line)) is None:
+        return None
+    try:
+        return namespace_match.group(1).decode()
+    except UnicodeDecodeError:
+        return None
+
+
 def _get_schema_version(namespace: str) -> int:
     """Get the schema version of the project."""
     try:
@@ -179,17 +202,3 @@ def _get_schema_version(namespace: str) -> int:
 
     _LOGGER.debug("Schema version: %s", schema_version)
     return schema_version
-
-
-def _generate_ets6_zip_password(password: str) -> bytes:
-    """Generate ZIP archive password."""
-
-    return base64.b64encode(
-        hashlib.pbkdf2_hmac(
-            hash_name="sha256",
-            password=password.encode("utf-16-le"),
-            salt=b"21.project.ets.knx.org",
-            iterations=65536,
-            dklen=32,
-        )
-    )